@@ -40,7 +40,7 @@ def load_state(claude_dir: Path) -> dict:
 def save_state(claude_dir: Path, state: dict):
     """Save session state to file."""
     state_file = claude_dir / ".session-state.json"
-    state_file.write_text(json.dumps(state, indent=2))
+    state_file.write_text(json.dumps(state, separators=(",", ":")))
 
 
 def record_milestone(claude_dir: Path, description: str):